@@ -180,6 +180,7 @@ def op_fix(app, source):
         if not source.meta:
             app.printer.action("removing", source.path)
             app.lambdaenv.rm(source.path)
+            source.refresh()
 
     target = None
     if source.isfile():
@@ -211,6 +212,8 @@ def op_fix(app, source):
                 app.printer.action("adding insane file - " + s.relativepath())
                 app.printer.action("                as - " + t.relativepath())
                 db.add(app, s, t)
+                # add might have moved the source.
+                s.refresh()
 
                 if s.isfile():
                     app.printer.action("removing insane file - " + s.relativepath())
@@ -339,16 +342,16 @@ def main(app):
 
     elif app.args[0] in ("rm", "remove"):  # remove files from depos
         print_if_verbose(app, "Pretending to remove", "Removing")
-        musync.op.operate(app, op_remove)
+        musync.op.operate(app, op_remove, plan=True)
 
     elif app.args[0] in ("add", "sync"):  # synchronize files with musicdb
         print_if_verbose(app, "Pretending to add", "Adding")
-        musync.op.operate(app, op_add)
+        musync.op.operate(app, op_add, plan=True)
 
     elif app.args[0] in ("fix",):  # synchronize files with musicdb
         print_if_verbose(app, "Pretending to fix", "Fixing")
         # make sure all paths are referenced relative to root.
-        musync.op.operate(app, op_fix)
+        musync.op.operate(app, op_fix, plan=True)
 
     elif app.args[0] in ("lock",):
         print_if_verbose(app, "Pretending to lock", "Locking")
@@ -372,6 +375,19 @@ def main(app):
             app.printer.boldnotice("# Done!")
 
     app.locker.stop()
+
+    if app.tagcache is not None:
+        app.tagcache.close()
+
+        if app.lambdaenv.verbose:
+            app.printer.boldnotice(
+                "tag cache:",
+                app.tagcache.hits,
+                "hits and",
+                app.tagcache.misses,
+                "misses",
+            )
+
     return 0
 
 
@@ -26,10 +26,14 @@
 from __future__ import annotations
 
 import os
+import stat
 from typing import Any, Generator
 
 import musync.formats
 
+# marks metadata and stat results that have not been read yet.
+_NOTLOADED = object()
+
 
 class Path:
     """
@@ -37,38 +41,84 @@ class Path:
     this is a wrapper for directories, used in musync
     to represent different locations on a filesystem and
     aid in simplifying the code at _many_ locations.
+
+    the result of stat is remembered, use refresh() after the file has been
+    changed on disk.
     """
 
+    __slots__ = (
+        "app",
+        "dir",
+        "ext",
+        "basename",
+        "path",
+        "target",
+        "_meta",
+        "_stat",
+        "_lstat",
+    )
+
     def __init__(self, app: Any, path: str, **kw: Any) -> None:
         """
         initiate variables.
+
+        metadata is read the first time 'meta' is used, pass meta=None to
+        build a path-only Path which never reads tags (or meta=<MetaFile>
+        if the metadata has been read elsewhere).
+        a stat result (following symlinks) which is already known can be
+        passed as stat=<os.stat_result>.
         """
 
         self.app = app
 
-        self._path = os.path.abspath(path)
+        path = os.path.abspath(path)
 
         if "dir" in kw:
             self.dir = kw.get("dir")
         else:
-            self.dir = os.path.dirname(self._path)
+            self.dir = os.path.dirname(path)
 
         if "ext" in kw:
             self.ext = kw.get("ext")
         else:
-            self.ext = os.path.splitext(self._path)[1].lower()
+            self.ext = os.path.splitext(path)[1].lower()
             if len(self.ext) > 0 and self.ext[0] == ".":
                 self.ext = self.ext[1:]
 
         if "basename" in kw:
             self.basename = kw.get("basename")
         else:
-            self.basename = os.path.splitext(self._path)[0]
+            self.basename = os.path.splitext(path)[0]
 
-        # open metadata if this is a file
-        # if this is None, it's an indication that the file is not supported.
-        if self.isfile():
-            self.meta = musync.formats.open(self.path, **self.app.lambdaenv.modify)
+        self.path = self.get_path()
+
+        # target path, when it has been planned ahead (see dbman.plan_target).
+        self.target = None
+
+        self._meta = kw.get("meta", _NOTLOADED)
+        self._stat = kw.get("stat", _NOTLOADED)
+        self._lstat = _NOTLOADED
+
+    def get_meta(self) -> Any:
+        """
+        metadata of this file, read on first use.
+        if this is None, it's an indication that the file is not supported
+        (or not a file at all).
+        """
+        if self._meta is _NOTLOADED:
+            if self.isfile():
+                self._meta = musync.formats.open(
+                    self.path, self.stat(), **self.app.lambdaenv.modify
+                )
+            else:
+                self._meta = None
+
+        return self._meta
+
+    def set_meta(self, meta: Any) -> None:
+        self._meta = meta
+
+    meta = property(get_meta, set_meta)
 
     def get_path(self) -> str:
         if self.ext:
@@ -76,19 +126,57 @@ class Path:
         else:
             return os.path.join(self.dir, self.basename)
 
-    path = property(get_path)
+    def lstat(self) -> os.stat_result | None:
+        """
+        lstat result of this path, None if it does not exist.
+        """
+        if self._lstat is _NOTLOADED:
+            try:
+                self._lstat = os.lstat(self.path)
+            except (OSError, ValueError):
+                self._lstat = None
+
+        return self._lstat
+
+    def stat(self) -> os.stat_result | None:
+        """
+        stat result of this path (following symlinks), None if it does not
+        exist or is a broken link.
+        """
+        if self._stat is _NOTLOADED:
+            st = self.lstat()
+
+            if st is not None and stat.S_ISLNK(st.st_mode):
+                try:
+                    st = os.stat(self.path)
+                except (OSError, ValueError):
+                    st = None
+
+            self._stat = st
+
+        return self._stat
+
+    def refresh(self) -> None:
+        """
+        forget the stat results, call this after modifying the path.
+        """
+        self._stat = _NOTLOADED
+        self._lstat = _NOTLOADED
 
     def isfile(self) -> bool:
-        return os.path.isfile(self.path)
+        st = self.stat()
+        return st is not None and stat.S_ISREG(st.st_mode)
 
     def isdir(self) -> bool:
-        return os.path.isdir(self.path)
+        st = self.stat()
+        return st is not None and stat.S_ISDIR(st.st_mode)
 
     def islink(self) -> bool:
-        return os.path.islink(self.path)
+        st = self.lstat()
+        return st is not None and stat.S_ISLNK(st.st_mode)
 
     def exists(self) -> bool:
-        return os.path.exists(self.path)
+        return self.stat() is not None
 
     def isempty(self) -> bool:
         if self.isdir():
@@ -96,9 +184,6 @@ class Path:
                 return False
         return True
 
-    def basename(self) -> str:
-        return os.path.basename(self.path)
-
     def dirname(self) -> str:
         return os.path.dirname(self.path)
 
@@ -106,6 +191,7 @@ class Path:
         if self.isdir():
             if self.isempty():
                 os.rmdir(self.path)
+                self.refresh()
 
     def children(self) -> Generator[Path, None, None]:
         """
@@ -122,7 +208,7 @@ class Path:
         return
 
     def parent(self) -> Path:
-        return Path(self.app, os.path.dirname(self.path))
+        return Path(self.app, os.path.dirname(self.path), meta=None)
 
     def walk(self, test: Any) -> Generator[Path, None, None]:
         """
@@ -38,6 +38,7 @@
 import musync.errors
 import musync.commons
 import tempfile
+import threading
 
 import os
 
@@ -63,11 +64,44 @@ def build_target(app: Any, source: Any, **kw: Any) -> Path:
                  notice that this should have been cleaned with
                  musync.meta.cleanmeta();
     """
+    if not kw and isinstance(source, Path) and source.target is not None:
+        return source.target
+
+    # targets are only ever checked for existance and locks, never for tags.
+    kw.setdefault("meta", None)
+
     return musync.commons.Path(
         app, os.path.join(app.lambdaenv.root, app.lambdaenv.targetpath(source)), **kw
     )
 
 
+def plan_target(app: Any, source: Path) -> Path:
+    """
+    build the target of source ahead of time, later calls to build_target
+    for the same source will return it without evaluating targetpath again.
+    """
+    source.target = build_target(app, source)
+    return source.target
+
+
+# targets currently being added, so that two threads never write the same file.
+_claimed = set()
+_claimed_lock = threading.Lock()
+
+
+def claim(path: str) -> bool:
+    with _claimed_lock:
+        if path in _claimed:
+            return False
+        _claimed.add(path)
+        return True
+
+
+def release(path: str) -> None:
+    with _claimed_lock:
+        _claimed.discard(path)
+
+
 def hash_get(app: Any, path: str) -> Any:
     return app.lambdaenv.hash(path)
 
@@ -75,12 +109,13 @@ def hash_get(app: Any, path: str) -> Any:
 def add(app: Any, p: Path, t: Path) -> bool | None:
     "adds a file to the database"
 
-    import hashlib
-
     if not t.parent().isdir():
         # recursively makes directories.
         try:
             os.makedirs(t.dir)
+        except FileExistsError:
+            # another thread got here first.
+            pass
         except OSError as e:
             raise musync.errors.FatalException(str(e))
 
@@ -88,6 +123,19 @@ def add(app: Any, p: Path, t: Path) -> bool | None:
         app.printer.warning("source and target file same")
         return
 
+    if not claim(t.path):
+        app.printer.warning("file already exists:", t.relativepath())
+        return
+
+    try:
+        return _add(app, p, t)
+    finally:
+        release(t.path)
+
+
+def _add(app: Any, p: Path, t: Path) -> bool | None:
+    import hashlib
+
     if (t.exists() or t.islink()) and not app.lambdaenv.force:
         app.printer.warning("file already exists:", t.relativepath())
         return
@@ -95,6 +143,7 @@ def add(app: Any, p: Path, t: Path) -> bool | None:
     # by this time, we want it removed.
     if t.exists() or t.islink():
         app.lambdaenv.rm(t)
+        t.refresh()
 
     attempts = 0
     parity = None
@@ -112,6 +161,8 @@ def add(app: Any, p: Path, t: Path) -> bool | None:
             parity = hash_get(app, p.path)
 
         app.lambdaenv.add(p.path, t.path)
+        p.refresh()
+        t.refresh()
 
         # if settings prompt, check target file hash.
         if app.lambdaenv.checkhash:
@@ -140,4 +191,5 @@ def remove(app: Any, p: Path, t: Path) -> bool | None:
         return
 
     app.lambdaenv.rm(t)
+    t.refresh()
     return True
@@ -6,25 +6,55 @@ import musync.formats.id3
 import musync.formats.oggvorbis
 import musync.formats.mp4
 
+from .id3 import ID3MetaFile
+from .oggvorbis import OggVCommentMetaFile, VCFLACMetaFile
+from .mp4 import MP4TagsMetaFile
 
-def open(path, **kw):
+# the MetaFile classes open() can return, by name.
+KINDS = {
+    cls.__name__: cls
+    for cls in (ID3MetaFile, OggVCommentMetaFile, VCFLACMetaFile, MP4TagsMetaFile)
+}
+
+# a musync.tagcache.TagCache consulted before reading any tags, set up by
+# musync.opts when 'tagcache' is configured.
+cache = None
+
+
+def read(path):
+    """
+    read the metadata of path, without consulting the cache.
+    """
     f = mutagen.File(path)
 
     if not f:
         return None
 
     tags = f.tags
-    o = None
 
     if isinstance(tags, mutagen.id3.ID3):
-        o = musync.formats.id3.ID3MetaFile(f, tags)
+        return musync.formats.id3.ID3MetaFile(f, tags)
     elif isinstance(tags, mutagen.oggvorbis.OggVCommentDict):
-        o = musync.formats.oggvorbis.OggVCommentMetaFile(f, tags)
+        return musync.formats.oggvorbis.OggVCommentMetaFile(f, tags)
     elif isinstance(tags, mutagen.flac.VCFLACDict):
-        o = musync.formats.oggvorbis.VCFLACMetaFile(f, tags)
+        return musync.formats.oggvorbis.VCFLACMetaFile(f, tags)
     elif isinstance(tags, mutagen.mp4.MP4Tags):
-        o = musync.formats.mp4.MP4TagsMetaFile(f, tags)
+        return musync.formats.mp4.MP4TagsMetaFile(f, tags)
+
+    return None
+
+
+def open(path, st=None, **kw):
+    """
+    open the metadata of path, st is the stat result of path if it is
+    already known (it saves the cache a stat call).
+    """
+    if cache is not None:
+        o = cache.open(path, read, st)
     else:
+        o = read(path)
+
+    if o is None:
         return None
 
     for k in list(kw.keys()):
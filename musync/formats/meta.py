@@ -5,18 +5,16 @@ from typing import Any
 class MetaFile:
     __translate__: Any = None
 
+    # the fields extracted from tags, in the order used by record().
+    FIELDS = ("artist", "album", "title", "track", "year")
+
     def __init__(self, f: Any, tags: dict[str, list[Any]]) -> None:
         self.album = None
         self.artist = None
         self.title = None
         self.track = None
         self.year = None
-        self.filename = os.path.basename(f.filename)
-
-        idx = self.filename.rfind(".")
-
-        if idx > 0:
-            self.ext = self.filename[idx + 1 :].lower()
+        self._setfilename(f.filename)
 
         if self.__translate__:
             for key in list(self.__translate__.keys()):
@@ -32,3 +30,30 @@ class MetaFile:
                         continue
 
                     setattr(self, attr, tags[tagkey][0])
+
+    def _setfilename(self, filename: str) -> None:
+        self.filename = os.path.basename(filename)
+
+        idx = self.filename.rfind(".")
+
+        if idx > 0:
+            self.ext = self.filename[idx + 1 :].lower()
+
+    def record(self) -> tuple[Any, ...]:
+        """
+        The extracted fields as a plain tuple, see FIELDS.
+        """
+        return tuple(getattr(self, field) for field in self.FIELDS)
+
+    @classmethod
+    def fromrecord(cls, filename: str, record: tuple[Any, ...]) -> "MetaFile":
+        """
+        Build an instance from a tuple created by record(), without any tags.
+        """
+        o = cls.__new__(cls)
+        o._setfilename(filename)
+
+        for field, value in zip(cls.FIELDS, record):
+            setattr(o, field, value)
+
+        return o
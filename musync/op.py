@@ -24,13 +24,18 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Generator
+from typing import Any, Callable, Generator, Iterable
 
 from musync.commons import Path
 from musync.errors import FatalException, WarningException
+from musync.pipeline import Pipeline, Stage
 import musync.opts
 import musync.commons
+import musync.dbman
+import musync.walker
+import os
 import sys
+import threading
 
 import traceback
 import musync.sign
@@ -38,28 +43,123 @@ import musync.sign
 # keep track of how many directories and files we are handling.
 handled_dirs = 0
 handled_files = 0
+_handled_lock = threading.Lock()
+
+# how much is read from stdin at once.
+READ_SIZE = 1 << 20
 
 import io
 
 
+def count(files: int = 0, dirs: int = 0) -> None:
+    """
+    Add to the handled files and directories counters.
+    """
+    global handled_dirs, handled_files
+    with _handled_lock:
+        handled_files += files
+        handled_dirs += dirs
+
+
 def operate(
-    app: Any, call: Callable[[Any, Path], None], inroot: bool = False
+    app: Any,
+    call: Callable[[Any, Path], None],
+    inroot: bool = False,
+    plan: bool = False,
 ) -> None:
     """
     Operation abstraction, this is the only function used by different operations.
+
+    @param plan  Build the target path of every file ahead of the operation,
+                 only useful for operations that use dbman.build_target.
     """
 
-    for p in readargs(app, app.args[1:], inroot):
-        if musync.sign.Interrupt is True:
-            musync.sign.setret(musync.sign.INTERRUPT)
-            raise FatalException("Caught Interrupt")
+    if app.lambdaenv.jobs > 1:
+        paths = operate_pipeline(app, call, inroot, plan)
+    else:
+        paths = readargs(app, app.args[1:], inroot)
 
+    for p in interrupted(paths):
         try:
             call(app, p)
         except WarningException as e:  # WarningExceptions are just printed, then move of to next file.
             app.printer.warning(str(e))
 
 
+def interrupted(paths: Iterable[Path]) -> Generator[Path, None, None]:
+    """
+    Pass paths through until an interrupt has been caught.
+    """
+    for p in paths:
+        if musync.sign.Interrupt is True:
+            musync.sign.setret(musync.sign.INTERRUPT)
+            raise FatalException("Caught Interrupt")
+
+        yield p
+
+
+def operate_pipeline(
+    app: Any, call: Callable[[Any, Path], None], inroot: bool, plan: bool
+) -> list[Path]:
+    """
+    Run an operation with app.lambdaenv.jobs threads per stage.
+
+    discovery happens in the calling thread, then every path goes trough:
+      stat   - find out what kind of path this is.
+      tags   - read metadata of files.
+      plan   - build the target path (if plan is set).
+      action - the operation itself (lock check, transfer and verify).
+
+    directories are not handled here since they can only be operated on
+    after everything beneath them, they are returned (in order) instead.
+    """
+    jobs = app.lambdaenv.jobs
+    dirs = []
+
+    def discover():
+        for p in readargs(app, app.args[1:], inroot):
+            if p.isdir():
+                dirs.append(p)
+                continue
+            yield p
+
+    def stat_stage(p):
+        p.exists()
+        return p
+
+    def tags_stage(p):
+        if p.isfile():
+            p.meta
+        return p
+
+    def plan_stage(p):
+        if p.isfile() and p.meta:
+            musync.dbman.plan_target(app, p)
+        return p
+
+    def action_stage(p):
+        call(app, p)
+
+    def onerror(p, e):
+        if not isinstance(e, WarningException):
+            raise e
+        app.printer.warning(str(e))
+
+    stages = [
+        Stage("stat", stat_stage, jobs),
+        Stage("tags", tags_stage, jobs),
+    ]
+
+    if plan:
+        stages.append(Stage("plan", plan_stage, jobs))
+
+    stages.append(Stage("action", action_stage, jobs))
+
+    pipeline = Pipeline(stages, maxsize=jobs * 4, onerror=onerror)
+    pipeline.run(interrupted(discover()))
+    return dirs
+
+
 #    if app.lambdaenv.progress: ## run with progress.
 #        list=[];
 #        for p in readargs(args, inroot):
@@ -98,29 +198,90 @@ def readargs(
     yields the filepaths for easy access.
     """
     if len(args) <= 0:
+        files = readstdin(sys.stdin, app.lambdaenv.null)
+    else:
+        files = iter(args)
+
+    paths = (p for file in files for p in readpaths(app, file, inroot))
+
+    if app.lambdaenv.dedupe:
+        paths = dedupe(paths)
+
+    for p in paths:
+        yield p
+
+
+def readstdin(stream: Any, null: bool = False) -> Generator[str, None, None]:
+    """
+    reads paths from stream, one per line or separated by NUL if null is set.
+    the input is read in large blocks, empty paths are skipped and the last
+    path does not need a trailing separator.
+    """
+    stream = getattr(stream, "buffer", stream)
+    read = getattr(stream, "read1", stream.read)
+    sep = b"\0" if null else b"\n"
+    rest = b""
+
+    while True:
         try:
-            file = sys.stdin.readline()[:-1]
+            block = read(READ_SIZE)
         except Exception as e:
             raise FatalException(str(e))
 
-        while file:
-            for p in readpaths(app, file, inroot):
-                yield p
+        if not block:
+            break
 
-            file = sys.stdin.readline()[:-1]
-    else:
-        while len(args) > 0:
-            for p in readpaths(app, args[0], inroot):
-                yield p
+        if isinstance(block, str):
+            block = os.fsencode(block)
+
+        parts = (rest + block).split(sep)
+        rest = parts.pop()
+
+        for part in parts:
+            path = _decodepath(part, null)
+
+            if path:
+                yield path
 
-            args = args[1:]
+    path = _decodepath(rest, null)
+
+    if path:
+        yield path
+
+
+def _decodepath(part: bytes, null: bool) -> str:
+    # lines might come from a windows pipe.
+    if not null and part.endswith(b"\r"):
+        part = part[:-1]
+
+    return os.fsdecode(part)
+
+
+def dedupe(paths: Iterable[Path]) -> Generator[Path, None, None]:
+    """
+    skip paths which refer to the same file (st_dev, st_ino) as a path that
+    has already been yielded, e.g. a path given twice or a hardlink.
+    """
+    seen = set()
+
+    for p in paths:
+        st = p.stat()
+
+        if st is not None:
+            key = (st.st_dev, st.st_ino)
+
+            if key in seen:
+                continue
+
+            seen.add(key)
+
+        yield p
 
 
 def readpaths(
     app: Any, path: str, inroot: bool
 ) -> Generator[Path, None, None]:
     """ """
-    global handled_dirs, handled_files
     if inroot:
         path = app.lambdaenv.root + "/" + path
 
@@ -142,15 +303,23 @@ def readpaths(
     p = musync.commons.Path(app, path)
 
     if p.isfile():
-        handled_files += 1
+        count(files=1)
     elif p.isdir():
         if app.lambdaenv.recursive:
-            for f in p.children():
-                for t in readpaths(app, f.path, inroot):
-                    yield t
+            for entry in musync.walker.walk(p.path, sort=not app.lambdaenv.unsorted):
+                c = musync.commons.Path(app, entry.path)
+
+                if entry.isfile:
+                    count(files=1)
+                elif entry.isdir:
+                    if c.isroot():
+                        continue
+                    count(dirs=1)
+
+                yield c
 
         if p.isroot():
             return
-        handled_dirs += 1
+        count(dirs=1)
 
     yield p
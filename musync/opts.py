@@ -45,6 +45,8 @@ from musync.errors import FatalException
 import musync.locker
 import musync.custom
 import musync.printer
+import musync.formats
+import musync.tagcache
 
 # Click is a hard requirement - fail fast if not available
 try:
@@ -90,6 +92,12 @@ LambdaTemplate = {
     "debug": True,
     "configurations": [],
     "transcode": None,
+    "jobs": 1,
+    "unsorted": False,
+    "null": False,
+    "dedupe": False,
+    "tagcache": None,
+    "tagcache_size": 1000000,
 }
 
 
@@ -212,6 +220,7 @@ class AppSession:
     def __init__(self, argv, stream):
         self.configured = False
         self.locker = None
+        self.tagcache = None
         self.args = None
         self.printer = musync.printer.AppPrinter(self, stream)
         self.lambdaenv = LambdaEnviron(LambdaTemplate)
@@ -268,6 +277,21 @@ class AppSession:
                     self.lambdaenv.debug = True
                 case "--root":
                     self.lambdaenv.root = arg
+                case "--unsorted":
+                    self.lambdaenv.unsorted = True
+                case "-0" | "--null":
+                    self.lambdaenv.null = True
+                case "--dedupe":
+                    self.lambdaenv.dedupe = True
+                case "-j" | "--jobs":
+                    try:
+                        self.lambdaenv.jobs = int(arg)
+                    except ValueError:
+                        self.lambdaenv.jobs = 0
+
+                    if self.lambdaenv.jobs < 1:
+                        self.printer.error("jobs must be a positive number:", arg)
+                        return
                 case _:
                     self.printer.error("unkown option:", opt)
 
@@ -306,11 +330,25 @@ class AppSession:
                 return
 
         self.setup_locker(self.lambdaenv.lockdb())
+
+        if self.lambdaenv.tagcache:
+            self.setup_tagcache(self.lambdaenv.tagcache, self.lambdaenv.tagcache_size)
+
         self.args = args
         self.configured = True
 
     def setup_locker(self, path):
         self.locker = musync.locker.LockFileDB(self, path)
+
+    def setup_tagcache(self, path, size):
+        try:
+            self.tagcache = musync.tagcache.TagCache(path, size)
+        except Exception as e:
+            # a broken cache is no reason to stop, tags are just read every time.
+            self.printer.warning("could not open tag cache:", path, str(e))
+            return
+
+        musync.formats.cache = self.tagcache
     
     def _parse_with_click(self, argv):
         """
@@ -327,12 +365,13 @@ class AppSession:
         i = 0
         
         # Define valid options
-        short_opts = {'p', 'V', 'R', 'L', 's', 'v', 'f', 'c', 'M', 'd'}
+        short_opts = {'p', 'V', 'R', 'L', 's', 'v', 'f', 'c', 'M', 'd', 'j', '0'}
         long_opts = {
             'pretend', 'version', 'recursive', 'lock', 'silent', 
-            'verbose', 'force', 'root', 'config', 'modify', 'debug'
+            'verbose', 'force', 'root', 'config', 'modify', 'debug', 'jobs',
+            'unsorted', 'null', 'dedupe'
         }
-        opts_requiring_value = {'root', 'config', 'modify', 'c', 'M'}
+        opts_requiring_value = {'root', 'config', 'modify', 'jobs', 'c', 'M', 'j'}
         
         # Parse arguments manually to support [options] <operation> [files...]
         while i < len(argv):
@@ -489,6 +528,10 @@ class AppSession:
         @click.option('--config', '-c', type=str)
         @click.option('--modify', '-M', type=str)
         @click.option('--debug', '-d', is_flag=True)
+        @click.option('--jobs', '-j', type=str)
+        @click.option('--unsorted', is_flag=True)
+        @click.option('--null', '-0', is_flag=True)
+        @click.option('--dedupe', is_flag=True)
         def validate_opts(**kwargs):
             pass
         
@@ -588,6 +631,18 @@ def _manual_usage_text():
             --debug (-d):
                 Will enable printing of  traceback on
                 FatalExceptions [exc].
+            --jobs (or -j) <n> 'jobs':
+                Run operations in a pipeline (stat, tags, plan, action)
+                with this many worker threads per stage.
+            --unsorted 'unsorted':
+                Walk directories in the order the filesystem lists them
+                instead of sorting them, streams huge directories.
+            --null (or -0) 'null':
+                Paths read from stdin are separated by NUL instead of
+                newline, as written by find -print0.
+            --dedupe 'dedupe':
+                Skip paths which refer to a file that has already been
+                handled (the same path given twice, or hardlinks).
 
         Fancies:
             --progress (or -B):
@@ -654,6 +709,14 @@ def _generate_click_help():
                   help='Use metadata provided here instead of the one in files. key="new value" Valid keys are: artist - artist tag, album - album name, title - track title, track - track number')
     @click.option('--debug', '-d', is_flag=True,
                   help="Will enable printing of traceback on FatalExceptions [exc].")
+    @click.option('--jobs', '-j', type=int,
+                  help="Run operations in a pipeline with <n> worker threads per stage. 'jobs'")
+    @click.option('--unsorted', is_flag=True,
+                  help="Walk directories in filesystem order instead of sorted. 'unsorted'")
+    @click.option('--null', '-0', is_flag=True,
+                  help="Paths read from stdin are NUL separated (find -print0). 'null'")
+    @click.option('--dedupe', is_flag=True,
+                  help="Skip paths referring to a file already handled (duplicates, hardlinks). 'dedupe'")
     @click.argument('operation', required=False)
     @click.argument('files', nargs=-1, required=False)
     def musync_cmd(**kwargs):
@@ -705,6 +768,10 @@ def _generate_click_help():
         ("--config", "-c", "Specify configuration section. These work as overlays and the latest key specified is the one used, empty keys do not overwrite pre-defined.", "<section1>,<section2>,... 'default-config'"),
         ("--modify", "-M", 'Use metadata provided here instead of the one in files. Valid keys are: artist - artist tag, album - album name, title - track title, track - track number', 'key="new value"'),
         ("--debug", "-d", "Will enable printing of traceback on FatalExceptions [exc].", None),
+        ("--jobs", "-j", "Run operations in a pipeline (stat, tags, plan, action) with this many worker threads per stage.", "<n> 'jobs'"),
+        ("--unsorted", None, "Walk directories in the order the filesystem lists them instead of sorting them, streams huge directories.", "'unsorted'"),
+        ("--null", "-0", "Paths read from stdin are separated by NUL instead of newline, as written by find -print0.", "'null'"),
+        ("--dedupe", None, "Skip paths which refer to a file that has already been handled (the same path given twice, or hardlinks).", "'dedupe'"),
     ]
     
     for long_opt, short_opt, desc, conf_key in options_info:
@@ -0,0 +1,160 @@
+#
+# Musync pipeline - run an operation as a chain of threaded stages.
+#
+# every stage has its own pool of worker threads and hands items to the
+# next stage through a bounded queue. a slow stage will therefore block
+# the stages in front of it (backpressure) instead of having the whole
+# input buffered in memory.
+#
+# Copyright (C) 2007 Albin Stjerna, John-John Tedro
+#
+#    This file is part of Musync.
+#
+#    Musync is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Musync is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Musync.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Callable, Iterable
+
+# marks the end of the input for a single worker.
+_DONE = object()
+
+
+class Stage:
+    """
+    A single step in a pipeline.
+
+    func is called with each item and returns the item to hand to the next
+    stage, or None if the item should be dropped.
+    """
+
+    def __init__(
+        self, name: str, func: Callable[[Any], Any], workers: int = 1
+    ) -> None:
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+
+
+class Pipeline:
+    """
+    Connects a list of stages with bounded queues and runs them.
+
+    onerror is called (from the worker thread) with the item and the
+    exception whenever a stage raises, if it re-raises the pipeline is
+    aborted and the exception is raised again from run().
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        maxsize: int = 0,
+        onerror: Callable[[Any, Exception], None] | None = None,
+    ) -> None:
+        self.stages = stages
+        self.onerror = onerror
+        self.error = None
+        self._abort = threading.Event()
+        self._queues = [queue.Queue(maxsize) for _ in stages]
+        self._threads = []
+        self._running = [stage.workers for stage in stages]
+        self._lock = threading.Lock()
+
+    def abort(self, error: Exception | None = None) -> None:
+        """
+        Stop processing, items still in flight are drained and dropped.
+        """
+        with self._lock:
+            if self.error is None:
+                self.error = error
+        self._abort.set()
+
+    def aborted(self) -> bool:
+        return self._abort.is_set()
+
+    def _worker(self, index: int) -> None:
+        stage = self.stages[index]
+        inq = self._queues[index]
+
+        while True:
+            item = inq.get()
+
+            if item is _DONE:
+                break
+
+            # keep draining, so that nothing upstream blocks on a full queue.
+            if self._abort.is_set():
+                continue
+
+            try:
+                item = stage.func(item)
+            except Exception as e:
+                try:
+                    if self.onerror is None:
+                        raise
+                    self.onerror(item, e)
+                except Exception as e:
+                    self.abort(e)
+                continue
+
+            if item is None or index + 1 >= len(self.stages):
+                continue
+
+            self._queues[index + 1].put(item)
+
+        with self._lock:
+            self._running[index] -= 1
+            last = self._running[index] == 0
+
+        # the last worker to leave tells the next stage there is no more input.
+        if last and index + 1 < len(self.stages):
+            for _ in range(self.stages[index + 1].workers):
+                self._queues[index + 1].put(_DONE)
+
+    def run(self, items: Iterable[Any]) -> None:
+        """
+        Feed items into the first stage and wait for every stage to finish.
+        """
+        for i, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                t = threading.Thread(
+                    target=self._worker,
+                    args=(i,),
+                    name=f"musync-{stage.name}-{n}",
+                    daemon=True,
+                )
+                t.start()
+                self._threads.append(t)
+
+        first = self._queues[0]
+
+        try:
+            for item in items:
+                if self._abort.is_set():
+                    break
+                first.put(item)
+        except Exception as e:
+            self.abort(e)
+        finally:
+            for _ in range(self.stages[0].workers):
+                first.put(_DONE)
+
+            for t in self._threads:
+                t.join()
+
+        if self.error is not None:
+            raise self.error
@@ -29,6 +29,7 @@
 #
 
 import sys, os, codecs
+import threading
 
 
 class TermCapHolder:
@@ -59,6 +60,9 @@ class TermCaps:
     # Current artist and album in focus
     focused = {"artist": None, "album": None, "track": None, "title": None}
 
+    # serializes output when operations run in several threads.
+    _lock = threading.RLock()
+
     def __init__(self, stream):
         self.haslogged = False
         self.tc = True
@@ -155,10 +159,13 @@ class TermCaps:
             stream = self.stream
 
         kw.update(self.col)
-        stream.write(fmt.format(**kw))
+
+        with self._lock:
+            stream.write(fmt.format(**kw))
 
     def _writeall(self, *args, **kw):
-        kw.get("stream", self.stream).write("".join(args))
+        with self._lock:
+            kw.get("stream", self.stream).write("".join(args))
 
     def _unicodeencode(self, s):
         if isinstance(s, str):
@@ -248,16 +255,19 @@ class AppPrinter(TermCaps):
         """
         Set database focus on specific file and display some informative data.
         """
-        if self.focused["artist"] != meta.artist:
-            self.focused["artist"] = meta.artist
-            self.boldnotice(">", self.focused["artist"])
-
-        if self.focused["album"] != meta.album:
-            self.focused["album"] = meta.album
-            self.boldnotice("> >", self.focused["artist"], "/", self.focused["album"])
-
-        self.focused["title"] = meta.title
-        self.focused["track"] = meta.track
+        with self._lock:
+            if self.focused["artist"] != meta.artist:
+                self.focused["artist"] = meta.artist
+                self.boldnotice(">", self.focused["artist"])
+
+            if self.focused["album"] != meta.album:
+                self.focused["album"] = meta.album
+                self.boldnotice(
+                    "> >", self.focused["artist"], "/", self.focused["album"]
+                )
+
+            self.focused["title"] = meta.title
+            self.focused["track"] = meta.track
 
     def is_suppressed(self, type):
         "Checkes weither message type currently is suppressed trough configuration."
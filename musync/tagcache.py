@@ -0,0 +1,218 @@
+#
+# Musync tagcache - persistent cache of extracted metadata.
+#
+# files are identified by (st_dev, st_ino) and the cached entry is only
+# used as long as st_size and st_mtime_ns are unchanged, so a modified
+# file is re-read automatically. files that could not be opened are cached
+# as well, so unsupported files do not have to be probed again.
+#
+# Copyright (C) 2007 Albin Stjerna, John-John Tedro
+#
+#    This file is part of Musync.
+#
+#    Musync is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Musync is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Musync.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from typing import Any, Callable
+
+import musync.formats
+
+# pending writes are flushed to disk once there are this many.
+FLUSH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tags (
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    kind TEXT,
+    artist, album, title, track, year,
+    used INTEGER NOT NULL,
+    PRIMARY KEY (dev, ino)
+);
+CREATE INDEX IF NOT EXISTS tags_used ON tags (used);
+"""
+
+_CACHEABLE = (str, int, float, type(None))
+
+
+class TagCache:
+    """
+    sqlite backed cache of MetaFile records with LRU eviction.
+
+    @param path  the database file, created if it does not exist.
+    @param size  the maximum number of cached files, the least recently used
+                 entries are removed when it is exceeded.
+    """
+
+    def __init__(self, path: str, size: int = 1000000) -> None:
+        self.path = path
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._touched = {}
+        self._stored = {}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+        row = self._db.execute("SELECT MAX(used) FROM tags").fetchone()
+        self._tick = (row[0] or 0) + 1
+
+    def get(self, st: os.stat_result) -> tuple[bool, Any]:
+        """
+        look up a file by its stat result.
+        returns (found, (kind, record)), kind is None for unsupported files.
+        """
+        with self._lock:
+            row = self._stored.get((st.st_dev, st.st_ino))
+
+            if row is not None:
+                row = row[2:-1]
+            else:
+                row = self._db.execute(
+                    "SELECT size, mtime, kind, artist, album, title, track, year"
+                    " FROM tags WHERE dev = ? AND ino = ?",
+                    (st.st_dev, st.st_ino),
+                ).fetchone()
+
+            if row is None or row[0] != st.st_size or row[1] != st.st_mtime_ns:
+                self.misses += 1
+                return False, None
+
+            self.hits += 1
+            self._touched[(st.st_dev, st.st_ino)] = self._tick
+            self._flushable()
+
+        return True, (row[2], tuple(row[3:]))
+
+    def put(self, st: os.stat_result, meta: Any) -> None:
+        """
+        store the metadata (or None for unsupported files) of a file.
+        """
+        if meta is None:
+            kind, record = None, (None,) * len(musync.formats.meta.MetaFile.FIELDS)
+        else:
+            kind, record = type(meta).__name__, meta.record()
+
+            if kind not in musync.formats.KINDS:
+                return
+
+            if not all(isinstance(v, _CACHEABLE) for v in record):
+                return
+
+        with self._lock:
+            self._stored[(st.st_dev, st.st_ino)] = (
+                (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, kind)
+                + record
+                + (self._tick,)
+            )
+            self._flushable()
+
+    def open(
+        self,
+        path: str,
+        reader: Callable[[str], Any],
+        st: os.stat_result | None = None,
+    ) -> Any:
+        """
+        return the metadata of path from the cache, or read it with reader
+        (and remember it) if the file is unknown or has changed.
+        st is the stat result of path, it is looked up if not given.
+        """
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return reader(path)
+
+        found, value = self.get(st)
+
+        if found:
+            kind, record = value
+
+            if kind is None:
+                return None
+
+            return musync.formats.KINDS[kind].fromrecord(path, record)
+
+        meta = reader(path)
+        self.put(st, meta)
+        return meta
+
+    def _flushable(self) -> None:
+        if len(self._stored) + len(self._touched) >= FLUSH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._stored:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO tags"
+                " (dev, ino, size, mtime, kind, artist, album, title, track, year, used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                list(self._stored.values()),
+            )
+            self._stored = {}
+
+        if self._touched:
+            self._db.executemany(
+                "UPDATE tags SET used = ? WHERE dev = ? AND ino = ?",
+                [(used, dev, ino) for (dev, ino), used in self._touched.items()],
+            )
+            self._touched = {}
+
+        self._db.commit()
+
+    def evict(self) -> int:
+        """
+        remove the least recently used entries above the size limit.
+        returns the number of removed entries.
+        """
+        with self._lock:
+            self._flush()
+            (count,) = self._db.execute("SELECT COUNT(*) FROM tags").fetchone()
+
+            if count <= self.size:
+                return 0
+
+            self._db.execute(
+                "DELETE FROM tags WHERE rowid IN"
+                " (SELECT rowid FROM tags ORDER BY used LIMIT ?)",
+                (count - self.size,),
+            )
+            self._db.commit()
+            return count - self.size
+
+    def close(self) -> None:
+        """
+        write everything pending, evict and close the database.
+        """
+        self.evict()
+
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,162 @@
+#
+# Musync walker - iterative directory traversal built on os.scandir.
+#
+# the walker never builds commons.Path objects itself, it only yields
+# light-weight entries using the type (and stat) information that
+# os.scandir already has. it is up to the caller to decide which entries
+# are worth a full Path.
+#
+# Copyright (C) 2007 Albin Stjerna, John-John Tedro
+#
+#    This file is part of Musync.
+#
+#    Musync is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    Musync is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with Musync.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Generator, Iterator
+
+
+class WalkEntry:
+    """
+    A single path found while walking.
+    """
+
+    __slots__ = ("path", "name", "isdir", "isfile", "entry")
+
+    def __init__(
+        self, path: str, name: str, isdir: bool, isfile: bool, entry: Any = None
+    ) -> None:
+        self.path = path
+        self.name = name
+        self.isdir = isdir
+        self.isfile = isfile
+        # the os.DirEntry this was created from, if any.
+        self.entry = entry
+
+    def stat(self) -> os.stat_result:
+        """
+        stat result (following symlinks), cached by os.DirEntry when possible.
+        """
+        if self.entry is not None:
+            return self.entry.stat()
+        return os.stat(self.path)
+
+    def __repr__(self) -> str:
+        return f"WalkEntry({self.path!r})"
+
+
+def _entry(e: os.DirEntry) -> WalkEntry:
+    try:
+        isdir = e.is_dir()
+        isfile = not isdir and e.is_file()
+    except OSError:
+        isdir = isfile = False
+
+    return WalkEntry(e.path, e.name, isdir, isfile, e)
+
+
+def _identity(entry: WalkEntry) -> tuple[int, int] | None:
+    try:
+        st = entry.stat()
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _scan(path: str, sort: bool) -> Iterator[os.DirEntry]:
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return iter(())
+
+    if not sort:
+        return _stream(it)
+
+    with it:
+        try:
+            return iter(sorted(it, key=lambda e: e.name))
+        except OSError:
+            return iter(())
+
+
+def _stream(it: Any) -> Generator[os.DirEntry, None, None]:
+    with it:
+        try:
+            for e in it:
+                yield e
+        except OSError:
+            return
+
+
+def walk(
+    top: str,
+    sort: bool = True,
+    prune: Callable[[WalkEntry], bool] | None = None,
+) -> Generator[WalkEntry, None, None]:
+    """
+    walk everything beneath the directory top, depth-first.
+
+    directories are yielded after everything beneath them, top itself is not
+    yielded. directories which have already been visited (because of symlink
+    loops or several links to the same directory) are yielded, but not
+    descended into again.
+
+    @param sort   list each directory in sorted order, if False entries are
+                  streamed in the order the filesystem returns them, which
+                  keeps memory constant for huge directories.
+    @param prune  called with every directory entry before descending into
+                  it, returning True skips the directory and everything
+                  beneath it.
+    """
+    root = WalkEntry(top, os.path.basename(top), True, False)
+    visited = set()
+
+    ident = _identity(root)
+    if ident is not None:
+        visited.add(ident)
+
+    stack = [(root, _scan(top, sort))]
+
+    while stack:
+        current, it = stack[-1]
+
+        e = next(it, None)
+
+        if e is None:
+            stack.pop()
+            if stack:
+                yield current
+            continue
+
+        entry = _entry(e)
+
+        if not entry.isdir:
+            yield entry
+            continue
+
+        ident = _identity(entry)
+
+        if ident is not None:
+            if ident in visited:
+                yield entry
+                continue
+            visited.add(ident)
+
+        if prune is not None and prune(entry):
+            continue
+
+        stack.append((entry, _scan(entry.path, sort)))
@@ -32,6 +32,10 @@ def mock_app():
     app.lambdaenv.silent = False
     app.lambdaenv.suppressed = []
     app.lambdaenv.recursive = False
+    app.lambdaenv.jobs = 1
+    app.lambdaenv.unsorted = False
+    app.lambdaenv.null = False
+    app.lambdaenv.dedupe = False
     app.lambdaenv.modify = {}
     app.printer = Mock()
     app.locker = Mock()
@@ -40,3 +44,30 @@ def mock_app():
     app.settings = Mock()
     app.settings.targetpath = "targetpath"
     return app
+
+
+@pytest.fixture
+def make_mp3():
+    """Return a function writing a minimal, tagged mp3 file."""
+    import mutagen.id3
+
+    frames = {
+        "artist": mutagen.id3.TPE1,
+        "album": mutagen.id3.TALB,
+        "title": mutagen.id3.TIT2,
+        "track": mutagen.id3.TRCK,
+        "year": mutagen.id3.TDRC,
+    }
+
+    def make(path, **tags):
+        # ten silent MPEG-1 layer 3 frames (128kbps, 44.1kHz)
+        with open(path, "wb") as f:
+            f.write((b"\xff\xfb\x90\x00" + b"\x00" * 413) * 10)
+
+        id3 = mutagen.id3.ID3()
+        for key, value in tags.items():
+            id3.add(frames[key](encoding=3, text=[str(value)]))
+        id3.save(str(path))
+        return str(path)
+
+    return make
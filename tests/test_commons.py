@@ -142,3 +142,89 @@ def test_path_rmdir(mock_app, temp_dir):
     path = Path(mock_app, subdir)
     path.rmdir()
     assert not os.path.exists(subdir)
+
+
+def test_path_meta_is_lazy(mock_app, temp_file):
+    """Test Path only reads metadata on first access, and only once."""
+    from unittest.mock import patch
+    with patch("musync.formats.open", return_value="meta") as mock_open:
+        path = Path(mock_app, temp_file)
+        mock_open.assert_not_called()
+        assert path.meta == "meta"
+        assert path.meta == "meta"
+        mock_open.assert_called_once_with(path.path, path.stat())
+
+
+def test_path_meta_path_only(mock_app, temp_file):
+    """Test Path built with meta=None never reads metadata."""
+    from unittest.mock import patch
+    with patch("musync.formats.open") as mock_open:
+        path = Path(mock_app, temp_file, meta=None)
+        assert path.meta is None
+        mock_open.assert_not_called()
+
+
+def test_path_meta_directory(mock_app, temp_dir):
+    """Test Path.meta is None for directories."""
+    path = Path(mock_app, temp_dir)
+    assert path.meta is None
+
+
+def test_path_meta_setter(mock_app, temp_file):
+    """Test Path.meta can be assigned."""
+    path = Path(mock_app, temp_file)
+    path.meta = "assigned"
+    assert path.meta == "assigned"
+
+
+def test_path_stat_is_cached(mock_app, temp_file):
+    """Test the type checks of a Path share a single lstat."""
+    from unittest.mock import patch
+    path = Path(mock_app, temp_file)
+    with patch("musync.commons.os.lstat", wraps=os.lstat) as mock_lstat:
+        assert path.exists()
+        assert path.isfile()
+        assert not path.isdir()
+        assert not path.islink()
+    assert mock_lstat.call_count == 1
+
+
+def test_path_refresh(mock_app, temp_file):
+    """Test Path.refresh() forgets the stat result after a change."""
+    path = Path(mock_app, temp_file)
+    assert path.exists()
+    os.unlink(temp_file)
+    assert path.exists()
+    path.refresh()
+    assert not path.exists()
+    assert path.stat() is None
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires symlinks")
+def test_path_stat_follows_links(mock_app, temp_dir):
+    """Test stat() follows symlinks while lstat() does not."""
+    target = os.path.join(temp_dir, "target.mp3")
+    link = os.path.join(temp_dir, "link.mp3")
+    with open(target, "w") as f:
+        f.write("x")
+    try:
+        os.symlink(target, link)
+    except OSError:
+        pytest.skip("cannot create symlinks")
+
+    path = Path(mock_app, link)
+    assert path.islink()
+    assert path.isfile()
+
+    os.unlink(target)
+    broken = Path(mock_app, link)
+    assert broken.islink()
+    assert not broken.exists()
+
+
+def test_path_has_slots(mock_app, temp_file):
+    """Test Path has no per-instance __dict__."""
+    path = Path(mock_app, temp_file)
+    assert not hasattr(path, "__dict__")
+    with pytest.raises(AttributeError):
+        path.unknown = 1
@@ -1,4 +1,6 @@
 """Tests for musync.op module."""
+import io
+import os
 import pytest
 import sys
 from unittest.mock import Mock, patch, MagicMock
@@ -50,15 +52,47 @@ def test_readargs_with_args(mock_app, tmp_path):
     assert len(paths) == 1
 
 
-@patch("sys.stdin")
-def test_readargs_from_stdin(mock_stdin, mock_app, tmp_path):
+def test_readargs_from_stdin(mock_app, tmp_path):
     """Test readargs() reading from stdin."""
     test_file = tmp_path / "test.txt"
     test_file.write_text("content")
-    
-    mock_stdin.readline.side_effect = [str(test_file) + "\n", ""]
-    paths = list(musync.op.readargs(mock_app, [], False))
-    assert len(paths) >= 1
+
+    stdin = io.TextIOWrapper(io.BytesIO((str(test_file) + "\n").encode()))
+    with patch("sys.stdin", stdin):
+        paths = list(musync.op.readargs(mock_app, [], False))
+    assert [p.path for p in paths] == [str(test_file)]
+
+
+def test_readstdin_lines():
+    """Test readstdin() keeps the last path without a trailing newline."""
+    stream = io.BytesIO(b"a.mp3\r\n\nb c.mp3\nlast.mp3")
+    assert list(musync.op.readstdin(stream)) == ["a.mp3", "b c.mp3", "last.mp3"]
+
+
+def test_readstdin_null():
+    """Test readstdin() with NUL separated paths across block boundaries."""
+    names = ["x" * 10 + str(i) + "\n.mp3" for i in range(100)]
+    stream = io.BytesIO(b"\0".join(n.encode() for n in names) + b"\0")
+    with patch("musync.op.READ_SIZE", 7):
+        assert list(musync.op.readstdin(stream, null=True)) == names
+
+
+def test_readargs_dedupe(mock_app, tmp_path):
+    """Test readargs() skips repeated paths and hardlinks with dedupe."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("content")
+    link = tmp_path / "link.txt"
+    try:
+        os.link(str(test_file), str(link))
+    except (OSError, AttributeError):
+        pytest.skip("cannot create hardlinks")
+
+    args = [str(test_file), str(link), str(test_file)]
+    assert len(list(musync.op.readargs(mock_app, list(args), False))) == 3
+
+    mock_app.lambdaenv.dedupe = True
+    paths = list(musync.op.readargs(mock_app, list(args), False))
+    assert [p.path for p in paths] == [str(test_file)]
 
 
 def test_operate_basic(mock_app, tmp_path):
@@ -107,3 +141,69 @@ def test_operate_with_interrupt(mock_app, tmp_path):
         musync.op.operate(mock_app, mock_call)
     
     musync.sign.Interrupt = False  # Reset
+
+
+def test_operate_with_jobs(mock_app, tmp_path):
+    """Test operate() running the pipeline when jobs > 1."""
+    for i in range(20):
+        (tmp_path / f"test{i}.txt").write_text("content")
+
+    mock_app.args = ["add", str(tmp_path)]
+    mock_app.lambdaenv.recursive = True
+    mock_app.lambdaenv.jobs = 4
+    seen = []
+
+    def mock_call(app, path):
+        seen.append(path.path)
+
+    musync.op.operate(mock_app, mock_call)
+    # all files, followed by the directory itself
+    assert len(seen) == 21
+    assert str(tmp_path) in seen
+
+
+def test_operate_with_jobs_warning_exception(mock_app, tmp_path):
+    """Test operate() printing WarningExceptions raised from pipeline workers."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("content")
+
+    mock_app.args = ["add", str(test_file)]
+    mock_app.lambdaenv.jobs = 2
+
+    def mock_call(app, path):
+        raise WarningException("Test warning")
+
+    musync.op.operate(mock_app, mock_call)
+    mock_app.printer.warning.assert_called_with("Test warning")
+
+
+def test_operate_with_jobs_fatal_exception(mock_app, tmp_path):
+    """Test operate() re-raising FatalExceptions from pipeline workers."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("content")
+
+    mock_app.args = ["add", str(test_file)]
+    mock_app.lambdaenv.jobs = 2
+
+    def mock_call(app, path):
+        raise FatalException("Test fatal")
+
+    with pytest.raises(FatalException):
+        musync.op.operate(mock_app, mock_call)
+
+
+def test_readpaths_recursive_order(mock_app, tmp_path):
+    """Test readpaths() yields children before their directory, in sorted order."""
+    test_dir = tmp_path / "testdir"
+    (test_dir / "sub").mkdir(parents=True)
+    (test_dir / "sub" / "b.txt").write_text("content")
+    (test_dir / "a.txt").write_text("content")
+
+    mock_app.lambdaenv.recursive = True
+    paths = [p.path for p in musync.op.readpaths(mock_app, str(test_dir), False)]
+    assert paths == [
+        str(test_dir / "a.txt"),
+        str(test_dir / "sub" / "b.txt"),
+        str(test_dir / "sub"),
+        str(test_dir),
+    ]
@@ -202,6 +202,19 @@ class TestParseWithClick:
         assert "add" in args
         assert any("-p" in opt or "-R" in opt or "-v" in opt for opt, _ in opts)
 
+    def test_jobs_option(self):
+        session = Mock()
+        opts, args = musync.opts.AppSession._parse_with_click(session, ["-j", "4", "add", "file"])
+        assert ("-j", "4") in opts
+        assert args == ["add", "file"]
+
+    def test_null_and_dedupe_options(self):
+        session = Mock()
+        opts, args = musync.opts.AppSession._parse_with_click(session, ["-0", "--dedupe", "add"])
+        assert ("-0", "") in opts
+        assert ("--dedupe", "") in opts
+        assert args == ["add"]
+
     def test_unknown_long_opt_treated_as_operation(self):
         """Unknown long option is treated as start of operation (args)."""
         session = Mock()
@@ -0,0 +1,75 @@
+"""Tests for musync.pipeline module."""
+import threading
+import pytest
+from musync.pipeline import Pipeline, Stage
+
+
+def test_pipeline_passes_items_through_all_stages():
+    """Every item goes through each stage in order."""
+    results = []
+    lock = threading.Lock()
+
+    def collect(item):
+        with lock:
+            results.append(item)
+
+    stages = [
+        Stage("double", lambda x: x * 2, 3),
+        Stage("inc", lambda x: x + 1, 2),
+        Stage("collect", collect, 4),
+    ]
+    Pipeline(stages, maxsize=2).run(range(100))
+    assert sorted(results) == [x * 2 + 1 for x in range(100)]
+
+
+def test_pipeline_drops_none():
+    """Items for which a stage returns None are not passed on."""
+    results = []
+    stages = [
+        Stage("filter", lambda x: x if x % 2 == 0 else None, 2),
+        Stage("collect", results.append, 1),
+    ]
+    Pipeline(stages).run(range(10))
+    assert sorted(results) == [0, 2, 4, 6, 8]
+
+
+def test_pipeline_onerror_handles_exception():
+    """onerror is called for failing items, other items still go through."""
+    errors = []
+    results = []
+
+    def fail_on_three(x):
+        if x == 3:
+            raise ValueError("three")
+        return x
+
+    stages = [Stage("fail", fail_on_three, 2), Stage("collect", results.append)]
+    Pipeline(stages, onerror=lambda item, e: errors.append(str(e))).run(range(5))
+    assert errors == ["three"]
+    assert sorted(results) == [0, 1, 2, 4]
+
+
+def test_pipeline_reraising_onerror_aborts():
+    """An exception escaping onerror aborts the pipeline and is raised by run()."""
+
+    def fail(x):
+        raise RuntimeError("boom")
+
+    def onerror(item, e):
+        raise e
+
+    pipeline = Pipeline([Stage("fail", fail, 2)], maxsize=1, onerror=onerror)
+    with pytest.raises(RuntimeError):
+        pipeline.run(range(1000))
+    assert pipeline.aborted()
+
+
+def test_pipeline_input_error_aborts():
+    """An exception from the input iterable is raised by run()."""
+
+    def items():
+        yield 1
+        raise KeyError("input")
+
+    with pytest.raises(KeyError):
+        Pipeline([Stage("noop", lambda x: x)]).run(items())
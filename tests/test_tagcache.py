@@ -0,0 +1,111 @@
+"""Tests for musync.tagcache module."""
+import os
+import pytest
+from unittest.mock import Mock
+import musync.formats
+from musync.formats.id3 import ID3MetaFile
+from musync.tagcache import TagCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = TagCache(str(tmp_path / "cache" / "tags.db"))
+    yield c
+    c.close()
+
+
+def test_tagcache_creates_directory(tmp_path):
+    """TagCache creates the directory of its database."""
+    c = TagCache(str(tmp_path / "a" / "b" / "tags.db"))
+    c.close()
+    assert os.path.isfile(str(tmp_path / "a" / "b" / "tags.db"))
+
+
+def test_tagcache_miss_then_hit(cache, tmp_path, make_mp3):
+    """The reader is only used until the file is cached."""
+    path = make_mp3(tmp_path / "a.mp3", artist="Artist", album="Album", track="2/9")
+    reader = Mock(side_effect=musync.formats.read)
+
+    first = cache.open(path, reader)
+    second = cache.open(path, reader)
+
+    assert reader.call_count == 1
+    assert isinstance(second, ID3MetaFile)
+    assert second.record() == first.record() == ("Artist", "Album", None, 2, None)
+    assert second.filename == "a.mp3"
+    assert second.ext == "mp3"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_tagcache_invalidated_on_change(cache, tmp_path, make_mp3):
+    """A file with a new mtime is read again."""
+    path = make_mp3(tmp_path / "a.mp3", artist="Old")
+    cache.open(path, musync.formats.read)
+
+    make_mp3(tmp_path / "a.mp3", artist="New")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert cache.open(path, musync.formats.read).artist == "New"
+
+
+def test_tagcache_remembers_unsupported(cache, tmp_path):
+    """Files without metadata are cached as well."""
+    path = str(tmp_path / "cover.jpg")
+    with open(path, "w") as f:
+        f.write("not audio")
+
+    reader = Mock(return_value=None)
+    assert cache.open(path, reader) is None
+    assert cache.open(path, reader) is None
+    assert reader.call_count == 1
+
+
+def test_tagcache_persists(tmp_path, make_mp3):
+    """Entries survive closing and reopening the cache."""
+    db = str(tmp_path / "tags.db")
+    path = make_mp3(tmp_path / "a.mp3", title="Title")
+
+    c = TagCache(db)
+    c.open(path, musync.formats.read)
+    c.close()
+
+    c = TagCache(db)
+    reader = Mock()
+    assert c.open(path, reader).title == "Title"
+    reader.assert_not_called()
+    c.close()
+
+
+def test_tagcache_evicts_least_recently_used(tmp_path, make_mp3):
+    """Eviction keeps the most recently used entries."""
+    db = str(tmp_path / "tags.db")
+    old = make_mp3(tmp_path / "old.mp3", title="Old")
+    new = make_mp3(tmp_path / "new.mp3", title="New")
+
+    c = TagCache(db, size=1)
+    c.open(old, musync.formats.read)
+    c.close()
+
+    c = TagCache(db, size=1)
+    c.open(new, musync.formats.read)
+    assert c.evict() == 1
+    c.close()
+
+    c = TagCache(db, size=1)
+    assert c.get(os.stat(new))[0] is True
+    assert c.get(os.stat(old))[0] is False
+    c.close()
+
+
+def test_formats_open_uses_cache(tmp_path, make_mp3, monkeypatch):
+    """formats.open() consults the configured cache and applies modifications."""
+    path = make_mp3(tmp_path / "a.mp3", artist="Artist")
+    c = Mock()
+    c.open.return_value = ID3MetaFile.fromrecord(path, ("Cached", None, None, None, None))
+    monkeypatch.setattr(musync.formats, "cache", c)
+
+    meta = musync.formats.open(path, album="Modified")
+    c.open.assert_called_once_with(path, musync.formats.read, None)
+    assert meta.artist == "Cached"
+    assert meta.album == "Modified"
@@ -0,0 +1,84 @@
+"""Tests for musync.walker module."""
+import os
+import pytest
+from musync.walker import walk, WalkEntry
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Create a small directory tree."""
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "2.mp3").write_text("x")
+    (tmp_path / "b" / "1.mp3").write_text("x")
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "c").mkdir()
+    (tmp_path / "a" / "c" / "3.ogg").write_text("x")
+    (tmp_path / "z.flac").write_text("x")
+    return tmp_path
+
+
+def _rel(top, entries):
+    return [os.path.relpath(e.path, str(top)) for e in entries]
+
+
+def test_walk_sorted_post_order(tree):
+    """Entries come in sorted order, directories after their contents."""
+    entries = list(walk(str(tree)))
+    assert _rel(tree, entries) == [
+        os.path.join("a", "c", "3.ogg"),
+        os.path.join("a", "c"),
+        "a",
+        os.path.join("b", "1.mp3"),
+        os.path.join("b", "2.mp3"),
+        "b",
+        "z.flac",
+    ]
+
+
+def test_walk_entry_types(tree):
+    """Entries carry type information from scandir."""
+    entries = {e.name: e for e in walk(str(tree))}
+    assert entries["a"].isdir and not entries["a"].isfile
+    assert entries["z.flac"].isfile and not entries["z.flac"].isdir
+    assert entries["z.flac"].stat().st_size == 1
+
+
+def test_walk_unsorted_yields_same_entries(tree):
+    """Unsorted mode yields the same set of entries."""
+    assert sorted(_rel(tree, walk(str(tree), sort=False))) == sorted(
+        _rel(tree, walk(str(tree)))
+    )
+
+
+def test_walk_prune(tree):
+    """Pruned directories are neither yielded nor descended into."""
+    entries = _rel(tree, walk(str(tree), prune=lambda e: e.name == "a"))
+    assert entries == [os.path.join("b", "1.mp3"), os.path.join("b", "2.mp3"), "b", "z.flac"]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires symlinks")
+def test_walk_symlink_loop(tree):
+    """A symlink back to an ancestor is yielded but not followed."""
+    loop = tree / "a" / "c" / "loop"
+    try:
+        os.symlink(str(tree / "a"), str(loop))
+    except OSError:
+        pytest.skip("cannot create symlinks")
+
+    entries = _rel(tree, walk(str(tree)))
+    assert os.path.join("a", "c", "loop") in entries
+    assert not any(e.startswith(os.path.join("a", "c", "loop") + os.sep) for e in entries)
+
+
+def test_walk_missing_directory(tmp_path):
+    """Walking a directory that does not exist yields nothing."""
+    assert list(walk(str(tmp_path / "missing"))) == []
+
+
+def test_walk_entry_without_direntry(tmp_path):
+    """WalkEntry.stat() falls back to os.stat without a DirEntry."""
+    f = tmp_path / "f.mp3"
+    f.write_text("abc")
+    entry = WalkEntry(str(f), "f.mp3", False, True)
+    assert entry.stat().st_size == 3
+    assert "f.mp3" in repr(entry)